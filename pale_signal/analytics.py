@@ -3,29 +3,190 @@ Analytics and statistics for pale-signal.
 Computes rolling averages, correlations, and threshold-based insights.
 """
 
-import statistics
-from typing import List, Dict, Tuple
+import hashlib
+import io
+import os
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Tuple, Union
 
+import numpy as np
 
-def calculate_average(entries: List[Dict], metric: str) -> float:
+from .data_store import SOCIAL_TYPES, write_atomic
+
+
+# Cached summaries live next to the user's data
+CACHE_DIR = Path.home() / ".pale-signal" / "cache"
+
+# Part of every summary cache key; bump it whenever the summary text changes
+# so summaries cached by an older version are not served
+SUMMARY_FORMAT = 1
+
+# Most summaries kept on disk; older ones are removed when a new one is written
+CACHE_MAX_FILES = 16
+
+# Numeric metrics, in column order of the array built by to_columns
+# (social is excluded since it's categorical)
+METRICS = ["sleep_hours", "focus", "mood", "work_hours"]
+
+# Row/column indices of the metric pairs (upper triangle of the 4x4 matrix)
+_PAIR_ROWS, _PAIR_COLS = np.triu_indices(len(METRICS), k=1)
+
+# Entries as a list of dicts, or the equivalent to_columns array
+Entries = Union[List[Dict], np.ndarray]
+
+
+def to_columns(entries: List[Dict]) -> np.ndarray:
+    """
+    Build an (N, 4) C-contiguous float array of the numeric metrics.
+    Rows follow entry order; columns follow METRICS order.
+    """
+    return np.fromiter(
+        (entry[m] for entry in entries for m in METRICS),
+        dtype=np.float64,
+        count=len(entries) * len(METRICS),
+    ).reshape(len(entries), len(METRICS))
+
+
+def _as_columns(entries: Entries) -> np.ndarray:
+    """Return entries as a to_columns array, converting only if needed."""
+    if isinstance(entries, np.ndarray):
+        return entries
+    return to_columns(entries)
+
+
+def _corrcoef(arr: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation matrix of the columns of arr.
+    Columns with zero variance (or fewer than two rows) correlate as 0.0.
+    """
+    if len(arr) < 2:
+        return np.zeros((arr.shape[1], arr.shape[1]))
+    
+    # Shifting by the first row leaves the correlation unchanged but makes
+    # constant columns exactly zero, so rounding can't fake a variance
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.corrcoef(arr - arr[0], rowvar=False)
+    return np.nan_to_num(corr, nan=0.0)
+
+
+def _threshold_counts(arr: np.ndarray) -> np.ndarray:
+    """Count low sleep, low focus, low mood and long work days in a columns array."""
+    return np.array([
+        (arr[:, 0] < 6).sum(),
+        (arr[:, 1] < 4).sum(),
+        (arr[:, 2] < 4).sum(),
+        (arr[:, 3] > 10).sum(),
+    ], dtype=np.int64)
+
+
+# Histories at least this long use the numba kernel when numba is installed.
+# Each CLI run is a fresh process, so the kernel pays numba's import and
+# cache load every time (~0.3 s warm, ~1.3 s on first compile) while the
+# NumPy path takes ~0.1 ms per 1000 rows. Measured break-even with a warm
+# cache is between 1M rows (NumPy 0.09 s vs numba 0.35 s) and 10M rows
+# (0.94 s vs 0.69 s), far beyond any daily history.
+_JIT_MIN_ENTRIES = 10_000_000
+
+_jit_kernel = None
+
+
+def _summary_kernel_numpy(arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (column means, correlation matrix, threshold counts) using NumPy reductions."""
+    return arr.mean(axis=0), _corrcoef(arr), _threshold_counts(arr)
+
+
+def _summary_kernel_loop(arr):
+    """
+    Single-pass equivalent of _summary_kernel_numpy, written for numba.
+    Sums are taken relative to the first row so constant columns get
+    exactly zero variance.
+    """
+    n, k = arr.shape
+    shift = arr[0].copy()
+    sums = np.zeros(k)
+    cross = np.zeros((k, k))
+    counts = np.zeros(4, dtype=np.int64)
+    
+    for i in range(n):
+        for a in range(k):
+            da = arr[i, a] - shift[a]
+            sums[a] += da
+            for b in range(a, k):
+                cross[a, b] += da * (arr[i, b] - shift[b])
+        if arr[i, 0] < 6:
+            counts[0] += 1
+        if arr[i, 1] < 4:
+            counts[1] += 1
+        if arr[i, 2] < 4:
+            counts[2] += 1
+        if arr[i, 3] > 10:
+            counts[3] += 1
+    
+    means = shift + sums / n
+    
+    var = np.zeros(k)
+    for a in range(k):
+        var[a] = cross[a, a] - sums[a] * sums[a] / n
+    
+    corr = np.zeros((k, k))
+    for a in range(k):
+        for b in range(a, k):
+            if var[a] > 0 and var[b] > 0:
+                r = (cross[a, b] - sums[a] * sums[b] / n) / np.sqrt(var[a] * var[b])
+                r = min(1.0, max(-1.0, r))
+            else:
+                r = 0.0
+            corr[a, b] = r
+            corr[b, a] = r
+    
+    return means, corr, counts
+
+
+def _get_jit_kernel():
+    """Compile the loop kernel with numba on first use; NumPy if numba is missing."""
+    global _jit_kernel
+    if _jit_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _jit_kernel = _summary_kernel_numpy
+        else:
+            _jit_kernel = njit(cache=True)(_summary_kernel_loop)
+    return _jit_kernel
+
+
+def _summary_kernel(arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (column means, correlation matrix, threshold counts) for a columns array."""
+    if len(arr) >= _JIT_MIN_ENTRIES:
+        return _get_jit_kernel()(arr)
+    return _summary_kernel_numpy(arr)
+
+
+def calculate_average(entries: Entries, metric: str) -> float:
     """Calculate average for a specific metric."""
-    if not entries:
+    if len(entries) == 0:
         return 0.0
     
-    values = [entry[metric] for entry in entries]
-    return statistics.mean(values)
+    if isinstance(entries, np.ndarray):
+        return float(entries[:, METRICS.index(metric)].mean())
+    
+    total = 0.0
+    for entry in entries:
+        total += entry[metric]
+    return total / len(entries)
 
 
-def calculate_rolling_average(entries: List[Dict], metric: str, window: int = 7) -> float:
+def calculate_rolling_average(entries: Entries, metric: str, window: int = 7) -> float:
     """Calculate rolling average for the last N entries."""
-    if not entries:
+    if len(entries) == 0:
         return 0.0
     
     recent = entries[:window]
     return calculate_average(recent, metric)
 
 
-def calculate_correlation(entries: List[Dict], metric1: str, metric2: str) -> float:
+def calculate_correlation(entries: Entries, metric1: str, metric2: str) -> float:
     """
     Calculate Pearson correlation coefficient between two metrics.
     Returns value between -1 and 1.
@@ -33,65 +194,53 @@ def calculate_correlation(entries: List[Dict], metric1: str, metric2: str) -> fl
     if len(entries) < 2:
         return 0.0
     
-    values1 = [float(entry[metric1]) for entry in entries]
-    values2 = [float(entry[metric2]) for entry in entries]
-    
-    # Calculate means
-    mean1 = statistics.mean(values1)
-    mean2 = statistics.mean(values2)
-    
-    # Calculate correlation
-    numerator = sum((v1 - mean1) * (v2 - mean2) for v1, v2 in zip(values1, values2))
-    
-    sum_sq1 = sum((v1 - mean1) ** 2 for v1 in values1)
-    sum_sq2 = sum((v2 - mean2) ** 2 for v2 in values2)
-    
-    denominator = (sum_sq1 * sum_sq2) ** 0.5
-    
-    if denominator == 0:
-        return 0.0
-    
-    return numerator / denominator
+    if isinstance(entries, np.ndarray):
+        arr = entries[:, [METRICS.index(metric1), METRICS.index(metric2)]]
+    else:
+        arr = np.array([[entry[metric1], entry[metric2]] for entry in entries], dtype=np.float64)
+    return float(_corrcoef(arr)[0, 1])
 
 
-def identify_flags(entries: List[Dict]) -> List[str]:
+def identify_flags(entries: Entries) -> List[str]:
     """
     Identify threshold-based flags in the data.
     Returns list of insight strings.
     """
-    if not entries:
+    if len(entries) == 0:
         return []
     
+    return _format_flags(_threshold_counts(_as_columns(entries)), len(entries))
+
+
+def _format_flags(counts: np.ndarray, total: int) -> List[str]:
+    """Turn threshold counts (as from _threshold_counts) into insight strings."""
     flags = []
+    low_sleep_count, low_focus_count, low_mood_count, high_work_count = (int(c) for c in counts)
     
-    # Count low sleep days (< 6 hours)
-    low_sleep_count = sum(1 for e in entries if e["sleep_hours"] < 6)
+    # Low sleep days (< 6 hours)
     if low_sleep_count > 0:
-        pct = (low_sleep_count / len(entries)) * 100
-        flags.append(f"WARNING: Low sleep (<6h): {low_sleep_count}/{len(entries)} days ({pct:.1f}%)")
+        pct = (low_sleep_count / total) * 100
+        flags.append(f"WARNING: Low sleep (<6h): {low_sleep_count}/{total} days ({pct:.1f}%)")
     
-    # Count low focus days (< 4)
-    low_focus_count = sum(1 for e in entries if e["focus"] < 4)
+    # Low focus days (< 4)
     if low_focus_count > 0:
-        pct = (low_focus_count / len(entries)) * 100
-        flags.append(f"WARNING: Low focus (<4): {low_focus_count}/{len(entries)} days ({pct:.1f}%)")
+        pct = (low_focus_count / total) * 100
+        flags.append(f"WARNING: Low focus (<4): {low_focus_count}/{total} days ({pct:.1f}%)")
     
-    # Count low mood days (< 4)
-    low_mood_count = sum(1 for e in entries if e["mood"] < 4)
+    # Low mood days (< 4)
     if low_mood_count > 0:
-        pct = (low_mood_count / len(entries)) * 100
-        flags.append(f"WARNING: Low mood (<4): {low_mood_count}/{len(entries)} days ({pct:.1f}%)")
+        pct = (low_mood_count / total) * 100
+        flags.append(f"WARNING: Low mood (<4): {low_mood_count}/{total} days ({pct:.1f}%)")
     
-    # Count high work days (> 10 hours)
-    high_work_count = sum(1 for e in entries if e["work_hours"] > 10)
+    # High work days (> 10 hours)
     if high_work_count > 0:
-        pct = (high_work_count / len(entries)) * 100
-        flags.append(f"WARNING: Long work days (>10h): {high_work_count}/{len(entries)} days ({pct:.1f}%)")
+        pct = (high_work_count / total) * 100
+        flags.append(f"WARNING: Long work days (>10h): {high_work_count}/{total} days ({pct:.1f}%)")
     
     return flags
 
 
-def get_top_correlations(entries: List[Dict]) -> List[Tuple[str, str, float]]:
+def get_top_correlations(entries: Entries) -> List[Tuple[str, str, float]]:
     """
     Calculate correlations between all metric pairs.
     Returns list of (metric1, metric2, correlation) tuples, sorted by absolute correlation.
@@ -99,81 +248,141 @@ def get_top_correlations(entries: List[Dict]) -> List[Tuple[str, str, float]]:
     if len(entries) < 2:
         return []
     
-    # Exclude social since it's categorical
-    metrics = ["sleep_hours", "focus", "mood", "work_hours"]
-    correlations = []
+    return _rank_correlations(_corrcoef(_as_columns(entries)))
+
+
+def _rank_correlations(corr: np.ndarray) -> List[Tuple[str, str, float]]:
+    """Read metric pairs from the upper triangle of corr, strongest first."""
+    values = corr[_PAIR_ROWS, _PAIR_COLS]
     
-    for i, m1 in enumerate(metrics):
-        for m2 in metrics[i+1:]:
-            corr = calculate_correlation(entries, m1, m2)
-            correlations.append((m1, m2, corr))
+    # Sort by absolute correlation (strongest first); stable, so ties keep pair order
+    order = np.argsort(-np.abs(values), kind="stable")
     
-    # Sort by absolute correlation (strongest first)
-    correlations.sort(key=lambda x: abs(x[2]), reverse=True)
+    return [
+        (METRICS[_PAIR_ROWS[k]], METRICS[_PAIR_COLS[k]], float(values[k]))
+        for k in order
+    ]
+
+
+def _summary_cache_file(entries: List[Dict], arr: np.ndarray, days: int) -> Path:
+    """
+    Cache file for a summary, keyed by a digest of the entries' contents
+    (arr is their to_columns array), days and SUMMARY_FORMAT.
+    """
+    h = hashlib.blake2b(f"{SUMMARY_FORMAT}|{days}|{len(entries)}".encode(), digest_size=16)
+    h.update(arr.tobytes())
+    h.update("|".join(e.get("social", "none") for e in entries).encode())
+    return CACHE_DIR / f"{h.hexdigest()}.txt"
+
+
+def _prune_cache_dir(keep: Path):
+    """Remove the oldest cached summaries beyond CACHE_MAX_FILES, never keep."""
+    stamped = []
+    for path in CACHE_DIR.glob("*.txt"):
+        if path == keep:
+            continue
+        try:
+            stamped.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            pass
     
-    return correlations
+    stamped.sort(reverse=True)
+    for _, path in stamped[CACHE_MAX_FILES - 1:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
 
 
-def generate_summary(entries: List[Dict], days: int) -> str:
+def generate_summary(entries: List[Dict], days: int, use_cache: bool = True) -> str:
     """
     Generate a textual summary with statistics and insights.
+    
+    Unless use_cache is False, the result is cached on disk so repeated
+    summaries over unchanged data skip all computation.
     """
     if not entries:
         return "No data available."
     
+    # Build the columns once; they feed both the cache key and the summary
+    arr = to_columns(entries)
+    
+    if not use_cache:
+        return _build_summary(entries, arr, days)
+    
+    cache_file = _summary_cache_file(entries, arr, days)
+    try:
+        return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    
+    summary = _build_summary(entries, arr, days)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_atomic(cache_file, summary.encode("utf-8"))
+        _prune_cache_dir(cache_file)
+    except OSError:
+        # Caching is best-effort; the summary itself is still valid
+        pass
+    return summary
+
+
+def _build_summary(entries: List[Dict], arr: np.ndarray, days: int) -> str:
+    """Compute the summary text for a non-empty list of entries and their to_columns array."""
     actual_days = len(entries)
     
-    lines = []
-    lines.append(f"Summary for last {days} days ({actual_days} entries)")
-    lines.append("=" * 60)
-    lines.append("")
+    # One kernel call yields means, correlations and flag counts
+    avgs, corr, counts = _summary_kernel(arr)
+    
+    buf = io.StringIO()
+    write = buf.write
+    write(f"Summary for last {days} days ({actual_days} entries)\n")
+    write("=" * 60 + "\n\n")
     
     # Averages
-    lines.append("AVERAGES:")
-    lines.append(f"  Sleep:     {calculate_average(entries, 'sleep_hours'):.1f} hours")
-    lines.append(f"  Focus:     {calculate_average(entries, 'focus'):.1f} / 10")
-    lines.append(f"  Mood:      {calculate_average(entries, 'mood'):.1f} / 10")
-    lines.append(f"  Work:      {calculate_average(entries, 'work_hours'):.1f} hours")
+    write("AVERAGES:\n")
+    write(f"  Sleep:     {avgs[0]:.1f} hours\n")
+    write(f"  Focus:     {avgs[1]:.1f} / 10\n")
+    write(f"  Mood:      {avgs[2]:.1f} / 10\n")
+    write(f"  Work:      {avgs[3]:.1f} hours\n")
     
     # Social breakdown
-    social_counts = {}
-    for e in entries:
-        social_type = e.get("social", "none")
-        social_counts[social_type] = social_counts.get(social_type, 0) + 1
-    
-    lines.append("  Social:")
-    for social_type in ["none", "online", "casual", "meaningful", "deep"]:
-        count = social_counts.get(social_type, 0)
+    social_counts = Counter(e.get("social", "none") for e in entries)
+    
+    write("  Social:\n")
+    for social_type in SOCIAL_TYPES:
+        count = social_counts[social_type]
         if count > 0:
             pct = (count / actual_days) * 100
-            lines.append(f"    {social_type:12s} - {count}/{actual_days} days ({pct:.1f}%)")
-    lines.append("")
+            write(f"    {social_type:12s} - {count}/{actual_days} days ({pct:.1f}%)\n")
+    write("\n")
     
     # Rolling averages (7-day)
     if actual_days >= 7:
-        lines.append("7-DAY ROLLING AVERAGES:")
-        lines.append(f"  Sleep:     {calculate_rolling_average(entries, 'sleep_hours', 7):.1f} hours")
-        lines.append(f"  Focus:     {calculate_rolling_average(entries, 'focus', 7):.1f} / 10")
-        lines.append(f"  Mood:      {calculate_rolling_average(entries, 'mood', 7):.1f} / 10")
-        lines.append(f"  Work:      {calculate_rolling_average(entries, 'work_hours', 7):.1f} hours")
-        lines.append("")
-    
-    # Correlations
-    correlations = get_top_correlations(entries)
+        rolling = arr[:7].mean(axis=0)
+        write("7-DAY ROLLING AVERAGES:\n")
+        write(f"  Sleep:     {rolling[0]:.1f} hours\n")
+        write(f"  Focus:     {rolling[1]:.1f} / 10\n")
+        write(f"  Mood:      {rolling[2]:.1f} / 10\n")
+        write(f"  Work:      {rolling[3]:.1f} hours\n\n")
+    
+    # Correlations (need at least two entries)
+    correlations = _rank_correlations(corr) if actual_days >= 2 else []
     if correlations:
-        lines.append("TOP CORRELATIONS:")
+        write("TOP CORRELATIONS:\n")
         for m1, m2, corr in correlations[:3]:
             strength = "strong" if abs(corr) > 0.7 else "moderate" if abs(corr) > 0.4 else "weak"
             direction = "positive" if corr > 0 else "negative"
-            lines.append(f"  {m1} <-> {m2}: {corr:+.2f} ({strength} {direction})")
-        lines.append("")
+            write(f"  {m1} <-> {m2}: {corr:+.2f} ({strength} {direction})\n")
+        write("\n")
     
     # Flags
-    flags = identify_flags(entries)
+    flags = _format_flags(counts, actual_days)
     if flags:
-        lines.append("FLAGS:")
+        write("FLAGS:\n")
         for flag in flags:
-            lines.append(f"  {flag}")
-        lines.append("")
+            write(f"  {flag}\n")
+        write("\n")
     
-    return "\n".join(lines)
+    # Every section ends with a blank line; the text itself ends with one newline
+    return buf.getvalue()[:-1]
@@ -5,22 +5,58 @@ Usage:
     pale-signal add
     pale-signal summary [--days N]
     pale-signal plot <metric>
+    pale-signal export [--pretty]
 """
 
-import argparse
+import codecs
 import sys
 import os
 import platform
 from datetime import datetime
+from typing import Dict, List, Optional
 
 from . import data_store
-from . import analytics
-from . import visualize
+from .data_store import SOCIAL_TYPES
 
 
 VERSION = "1.0.4"
 
 
+PLOT_METRICS = ["sleep_hours", "focus", "mood", "work_hours", "social"]
+_VALID_METRICS = frozenset(PLOT_METRICS)
+
+
+SOCIAL_CHOICES = frozenset(SOCIAL_TYPES)
+
+
+SOCIAL_MENU = """Social interaction type:
+  none       - No social interaction
+  online     - Online/digital only (chat, video call)
+  casual     - Brief in-person (small talk, errands)
+  meaningful - Quality time with friends/family
+  deep       - Deep conversation or bonding
+"""
+SOCIAL_MENU_BYTES = SOCIAL_MENU.encode("utf-8")
+
+
+def _write_encoded(text: Optional[str], data: bytes):
+    """
+    Write pre-encoded UTF-8 output straight to stdout's binary buffer.
+    Falls back to the text layer if stdout has no buffer or another encoding;
+    text may be None, in which case data is decoded only for that fallback.
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or codecs.lookup(stream.encoding or "ascii").name != "utf-8":
+        stream.write(data.decode("utf-8") if text is None else text)
+        return
+    
+    # Flush pending text first so output stays in order
+    stream.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
 ASCII_BANNER = """
 ╔═══════════════════════════════════════════════════════════╗
 ║                                                           ║
@@ -34,6 +70,20 @@ ASCII_BANNER = """
 ╠═══════════════════════════════════════════════════════════╣
 ║          Track daily signals. Build awareness.            ║
 ╚═══════════════════════════════════════════════════════════╝
+
+"""
+
+BANNER_BYTES = ASCII_BANNER.encode("utf-8")
+
+
+COMMANDS_HELP = """Commands:
+  pale-signal add              Log today's data
+  pale-signal summary          View your stats
+  pale-signal plot <metric>    Generate a plot
+  pale-signal export           Print your data as JSON
+
+Metrics: sleep_hours, focus, mood, work_hours, social
+
 """
 
 
@@ -57,8 +107,9 @@ def check_for_updates():
 
 
 def show_banner():
-    """Display ASCII art banner and check for updates."""
-    print(ASCII_BANNER)
+    """Display ASCII art banner (interactive terminals only) and check for updates."""
+    if sys.stdout.isatty():
+        _write_encoded(ASCII_BANNER, BANNER_BYTES)
     check_for_updates()
 
 
@@ -70,8 +121,16 @@ def cmd_add():
     print(f"\nAdding data for {today}")
     print("=" * 60)
     
-    # Check if entry already exists
-    existing = data_store.get_entry_by_date(today)
+    # Check if entry already exists. If the data file is unchanged since
+    # the last add, its date answers that without loading the file.
+    last_add = data_store.read_last_add()
+    if last_add == today:
+        existing = True
+    elif last_add is not None and last_add < today:
+        existing = False
+    else:
+        existing = data_store.get_entry_by_date(today) is not None
+    
     if existing:
         print(f"WARNING: Entry for {today} already exists.")
         overwrite = input("Overwrite? (y/n): ").strip().lower()
@@ -132,68 +191,52 @@ def cmd_add():
                 print("Invalid input. Please enter a number.")
         
         # Social - with validation loop
-        valid_social = ["none", "online", "casual", "meaningful", "deep"]
         while True:
-            print("Social interaction type:")
-            print("  none       - No social interaction")
-            print("  online     - Online/digital only (chat, video call)")
-            print("  casual     - Brief in-person (small talk, errands)")
-            print("  meaningful - Quality time with friends/family")
-            print("  deep       - Deep conversation or bonding")
+            _write_encoded(SOCIAL_MENU, SOCIAL_MENU_BYTES)
             social = input("Choose (none/online/casual/meaningful/deep): ").strip().lower()
             
-            if social in valid_social:
+            if social in SOCIAL_CHOICES:
                 entry["social"] = social
                 break
             else:
-                print(f"ERROR: Invalid choice '{social}'. Please choose from: {', '.join(valid_social)}")
+                print(f"ERROR: Invalid choice '{social}'. Please choose from: {', '.join(SOCIAL_TYPES)}")
                 print("")
         
     except (ValueError, KeyboardInterrupt):
         print("\nERROR: Invalid input or cancelled.")
         return
     
-    # Validate and save
-    is_valid, error = data_store.validate_entry(entry)
-    if not is_valid:
-        print(f"ERROR: Validation error: {error}")
-        return
-    
-    # If overwriting, remove old entry first
-    if existing:
-        data = data_store.load_data()
-        data["entries"] = [e for e in data["entries"] if e["date"] != today]
-        data_store.save_data(data)
-    
-    success, error = data_store.add_entry(entry)
+    # Validate and save, replacing any existing entry for today. The file is
+    # read again here (free if unchanged) so edits made during the prompts
+    # are kept.
+    success, error = data_store.upsert_entry(entry)
     if success:
+        data_store.mark_last_add(today)
         print(f"\nSUCCESS: Data saved for {today} at {timestamp}")
     else:
         print(f"ERROR: {error}")
 
 
-def cmd_summary(days: int):
-    """Display summary statistics for the last N days."""
-    entries = data_store.get_entries(days)
-    using_dummy = False
-    
+def _resolve_entries(entries: List[Dict], demo_days: int, noun: str, verb: str):
+    """
+    Offer demo data when the user has no data or very little of it.
+    Returns (entries, using_dummy), or (None, False) if the user backs out.
+    """
     if not entries:
         # No data at all
         print("\nNo data yet.")
         response = input("Would you like to see a demo with sample data? (y/n): ").strip().lower()
         if response == 'y':
             from . import dummy_data
-            entries = dummy_data.generate_dummy_data(days)
-            using_dummy = True
-        else:
-            print("\nStart tracking with: pale-signal add")
-            return
+            return dummy_data.generate_dummy_data(demo_days), True
+        print("\nStart tracking with: pale-signal add")
+        return None, False
     
-    elif len(entries) < 3:
+    if len(entries) < 3:
         # Some data but limited
-        print(f"\nYou have {len(entries)} entries. 3+ recommended for meaningful stats.")
+        print(f"\nYou have {len(entries)} entries. 3+ recommended for meaningful {noun}.")
         print("\nOptions:")
-        print("  1. View your data anyway")
+        print(f"  1. {verb} your data anyway")
         print("  2. See demo with sample data")
         print("  3. Add more data first")
         
@@ -202,18 +245,34 @@ def cmd_summary(days: int):
             pass  # Use their data
         elif choice == '2':
             from . import dummy_data
-            entries = dummy_data.generate_dummy_data(days)
-            using_dummy = True
+            return dummy_data.generate_dummy_data(demo_days), True
         else:
             print("\nAdd data with: pale-signal add")
-            return
+            return None, False
+    
+    return entries, False
+
+
+def _print_demo_header():
+    """Announce that the output below is based on sample data."""
+    print("\n" + "=" * 60)
+    print("  DEMO MODE - This is sample data, not your actual data")
+    print("=" * 60)
+
+
+def cmd_summary(days: int):
+    """Display summary statistics for the last N days."""
+    from . import analytics
+    
+    entries, using_dummy = _resolve_entries(data_store.get_entries(days), days, "stats", "View")
+    if entries is None:
+        return
     
     if using_dummy:
-        print("\n" + "=" * 60)
-        print("  DEMO MODE - This is sample data, not your actual data")
-        print("=" * 60)
+        _print_demo_header()
     
-    summary = analytics.generate_summary(entries, days)
+    # Demo data is regenerated every run, so there is nothing to reuse
+    summary = analytics.generate_summary(entries, days, use_cache=not using_dummy)
     print("\n" + summary)
     
     if using_dummy:
@@ -224,58 +283,32 @@ def cmd_summary(days: int):
 
 def cmd_plot(metric: str):
     """Plot a specific metric over time."""
-    entries = data_store.get_entries()
-    using_dummy = False
-    
-    if not entries:
-        # No data at all
-        print("\nNo data yet.")
-        response = input("Would you like to see a demo with sample data? (y/n): ").strip().lower()
-        if response == 'y':
-            from . import dummy_data
-            entries = dummy_data.generate_dummy_data(30)
-            using_dummy = True
-        else:
-            print("\nStart tracking with: pale-signal add")
-            return
+    from . import visualize
     
-    elif len(entries) < 3:
-        # Some data but limited
-        print(f"\nYou have {len(entries)} entries. 3+ recommended for meaningful plots.")
-        print("\nOptions:")
-        print("  1. Plot your data anyway")
-        print("  2. See demo with sample data")
-        print("  3. Add more data first")
-        
-        choice = input("\nChoose (1/2/3): ").strip()
-        if choice == '1':
-            pass  # Use their data
-        elif choice == '2':
-            from . import dummy_data
-            entries = dummy_data.generate_dummy_data(30)
-            using_dummy = True
-        else:
-            print("\nAdd data with: pale-signal add")
-            return
+    entries, using_dummy = _resolve_entries(data_store.get_entries(), 30, "plots", "Plot")
+    if entries is None:
+        return
     
-    valid_metrics = ["sleep_hours", "focus", "mood", "work_hours", "social"]
-    if metric not in valid_metrics:
+    if metric not in _VALID_METRICS:
         print(f"ERROR: Invalid metric: {metric}")
-        print(f"Valid metrics: {', '.join(valid_metrics)}")
+        print(f"Valid metrics: {', '.join(PLOT_METRICS)}")
         return
     
     if using_dummy:
-        print("\n" + "=" * 60)
-        print("  DEMO MODE - This is sample data, not your actual data")
-        print("=" * 60)
+        _print_demo_header()
+        series = entries
+    else:
+        # The user's own data, as arrays built once from the loaded file
+        series = data_store.load_columns()
     
     # Show ASCII plot in terminal
-    ascii_plot = visualize.generate_ascii_plot(entries, metric)
+    ascii_plot = visualize.generate_ascii_plot(series, metric)
     if ascii_plot:
         print(ascii_plot)
     
     # Generate and save PNG plot
-    filename = visualize.plot_metric(entries, metric)
+    # Demo data is regenerated every run, so there is nothing to reuse
+    filename = visualize.plot_metric(series, metric, use_cache=not using_dummy)
     print(f"\nHigh-resolution plot saved to: {filename}")
     
     # Auto-open the plot
@@ -283,8 +316,80 @@ def cmd_plot(metric: str):
     visualize.auto_open_file(filename)
 
 
-def main():
-    """Main CLI entry point."""
+def cmd_export(pretty: bool):
+    """Write all data to stdout as JSON."""
+    _write_encoded(None, data_store.export_data(pretty) + b"\n")
+
+
+def _show_quick_reference():
+    """Show banner + quick reference (not full help)."""
+    show_banner()
+    sys.stdout.write(COMMANDS_HELP)
+    #print("More info: https://github.com/siddharth-narigra/pale-signal")
+
+
+def _parse_days(rest) -> Optional[int]:
+    """
+    Read summary's --days option from the remaining arguments.
+    Accepts "--days N" and "--days=N"; returns None if rest is anything else.
+    """
+    if not rest:
+        return 30
+    if len(rest) == 2 and rest[0] == "--days":
+        value = rest[1]
+    elif len(rest) == 1 and rest[0].startswith("--days="):
+        value = rest[0][len("--days="):]
+    else:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _dispatch_fast(argv) -> bool:
+    """
+    Run the common invocations directly, without importing argparse.
+    Returns False if argv needs full parsing (help, errors, other forms).
+    """
+    if not argv:
+        _show_quick_reference()
+        return True
+    
+    command = argv[0]
+    
+    if command == "add" and len(argv) == 1:
+        cmd_add()
+        return True
+    
+    if command == "--version" and len(argv) == 1:
+        print(f"pale-signal {VERSION}")
+        return True
+    
+    if command == "summary":
+        days = _parse_days(argv[1:])
+        if days is None:
+            return False
+        cmd_summary(days)
+        return True
+    
+    if command == "plot" and len(argv) == 2 and argv[1] in _VALID_METRICS:
+        cmd_plot(argv[1])
+        return True
+    
+    if command == "export" and argv[1:] in ([], ["--pretty"]):
+        cmd_export(len(argv) == 2)
+        return True
+    
+    return False
+
+
+def _main_argparse(argv):
+    """
+    Full argparse-based parsing, used only for help and malformed arguments
+    so that usage and error messages stay the same.
+    """
+    import argparse
     
     parser = argparse.ArgumentParser(
         prog='pale-signal',
@@ -305,9 +410,13 @@ def main():
     
     # Plot command
     plot_parser = subparsers.add_parser('plot', help='Generate plot')
-    plot_parser.add_argument('metric', choices=['sleep_hours', 'focus', 'mood', 'work_hours', 'social'])
+    plot_parser.add_argument('metric', choices=PLOT_METRICS)
     
-    args = parser.parse_args()
+    # Export command
+    export_parser = subparsers.add_parser('export', help='Print data as JSON')
+    export_parser.add_argument('--pretty', action='store_true', help='Indent for reading')
+    
+    args = parser.parse_args(argv)
     
     if args.command == 'add':
         cmd_add()
@@ -315,19 +424,22 @@ def main():
         cmd_summary(args.days)
     elif args.command == 'plot':
         cmd_plot(args.metric)
+    elif args.command == 'export':
+        cmd_export(args.pretty)
     else:
-        # Show banner + quick reference (not full help)
-        show_banner()
-        print("Commands:")
-        print("  pale-signal add              Log today's data")
-        print("  pale-signal summary          View your stats")
-        print("  pale-signal plot <metric>    Generate a plot")
-        print("")
-        print("Metrics: sleep_hours, focus, mood, work_hours, social")
-        print("")
-        #print("More info: https://github.com/siddharth-narigra/pale-signal")
+        _show_quick_reference()
         sys.exit(0)
 
 
+def main():
+    """Main CLI entry point."""
+    argv = sys.argv[1:]
+    
+    if _dispatch_fast(argv):
+        return
+    
+    _main_argparse(argv)
+
+
 if __name__ == '__main__':
     main()
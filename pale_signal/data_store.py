@@ -9,33 +9,213 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+# data.json is written compactly; _pretty_dump is for human-readable exports
+if orjson is not None:
+    def _loads(raw: bytes):
+        return orjson.loads(raw)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _pretty_dump(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _loads(raw: bytes):
+        return json.loads(raw)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _pretty_dump(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 # Store data in user's home directory
 DATA_DIR = Path.home() / ".pale-signal"
 DATA_FILE = DATA_DIR / "data.json"
 
+# Social interaction types; load_columns encodes them as their index here
+SOCIAL_TYPES = ("none", "online", "casual", "meaningful", "deep")
+_VALID_SOCIAL = frozenset(SOCIAL_TYPES)
+
+# Fields every entry must have, in the order missing ones are reported
+_REQUIRED_FIELDS = ("date", "sleep_hours", "focus", "mood", "work_hours", "social", "timestamp")
+
+# Set once the data directory and file are known to exist in this process
+_INITIALIZED = False
+
+# Parsed data.json, reused while the file's (mtime, size) is unchanged
+_CACHE = {"stamp": None, "data": None}
+
+# Date of the last successful add, written right after the data file
+LAST_ADD_FILE = DATA_DIR / ".last_add"
+
+# data.json is written as one entry per line, newest first, between these
+# lines; it stays ordinary JSON, but recent entries can be read from the top
+_ENTRIES_HEAD = b'{"entries":[\n'
+_ENTRIES_TAIL = b'\n]}'
+
+
+def write_atomic(path: Path, raw: bytes):
+    """
+    Replace path with raw in one write, so a crash never leaves it half-written.
+    The bytes go to a temp file that is fsynced and then renamed over path.
+    Used for every file pale-signal writes (data, marker, caches, plots).
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        # f.write loops over partial writes, e.g. on a nearly full disk
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 
 def _init_data_file():
-    """Initialize data.json if it doesn't exist."""
+    """Initialize data.json if it doesn't exist (checked once per process)."""
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+    
     # Create directory if it doesn't exist
     DATA_DIR.mkdir(exist_ok=True)
     
     if not DATA_FILE.exists():
-        with open(DATA_FILE, 'w') as f:
-            json.dump({"entries": []}, f, indent=2)
+        write_atomic(DATA_FILE, _dump_data({"entries": []}))
+    _INITIALIZED = True
+
+
+def _dump_data(payload: Dict) -> bytes:
+    """Serialize data for data.json, one entry per line (see _ENTRIES_HEAD)."""
+    if payload.keys() != {"entries"}:
+        return _dumps(payload)
+    return _ENTRIES_HEAD + b",\n".join(map(_dumps, payload["entries"])) + _ENTRIES_TAIL
+
+
+def _read_first_entries(days: int) -> Optional[List[Dict]]:
+    """
+    Parse only the first (newest) days entries of data.json.
+    Returns None if the file isn't in the one-entry-per-line layout.
+    """
+    entries = []
+    try:
+        with open(DATA_FILE, "rb") as f:
+            if f.readline() != _ENTRIES_HEAD:
+                return None
+            for line in f:
+                if len(entries) == days:
+                    break
+                line = line.rstrip(b",\n")
+                if not line or line == b"]}":
+                    break
+                entries.append(_loads(line))
+    except ValueError:
+        # Hand-edited or otherwise irregular; parse the whole file instead
+        return None
+    return entries
+
+
+def _file_stamp() -> tuple:
+    """Identify the current version of DATA_FILE by mtime and size."""
+    st = DATA_FILE.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _index_entries(data: Dict) -> Dict[str, Dict]:
+    """
+    Attach a date -> entry index to data as data["_index"].
+    The index lives in memory only; save_data never writes it.
+    """
+    index = {e["date"]: e for e in data["entries"]}
+    data["_index"] = index
+    return index
+
+
+def _date_index(data: Dict) -> Dict[str, Dict]:
+    """Get data's date index, building it if data didn't come from load_data."""
+    index = data.get("_index")
+    if index is None:
+        index = _index_entries(data)
+    return index
 
 
 def load_data() -> Dict:
-    """Load all data from JSON file."""
+    """
+    Load all data from JSON file.
+    Repeated calls reuse the parsed data until the file changes on disk.
+    """
     _init_data_file()
-    with open(DATA_FILE, 'r') as f:
-        return json.load(f)
+    stamp = _file_stamp()
+    if _CACHE["data"] is not None and _CACHE["stamp"] == stamp:
+        return _CACHE["data"]
+    
+    data = _loads(DATA_FILE.read_bytes())
+    _index_entries(data)
+    _CACHE["stamp"] = stamp
+    _CACHE["data"] = data
+    return data
+
+
+def _payload(data: Dict) -> Dict:
+    """data without its in-memory views ("_index", "_columns")."""
+    return {k: v for k, v in data.items() if not k.startswith("_")}
 
 
 def save_data(data: Dict):
     """Save data to JSON file."""
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_atomic(DATA_FILE, _dump_data(_payload(data)))
+    
+    # Callers may have edited the entries directly, so re-index and
+    # let load_columns rebuild its arrays on demand
+    _index_entries(data)
+    data.pop("_columns", None)
+    
+    # What was just written is the new cached version of the file
+    _CACHE["stamp"] = _file_stamp()
+    _CACHE["data"] = data
+
+
+def export_data(pretty: bool = False) -> bytes:
+    """All data as JSON bytes, indented for reading if pretty is True."""
+    payload = _payload(load_data())
+    return _pretty_dump(payload) if pretty else _dumps(payload)
+
+
+def read_last_add() -> Optional[str]:
+    """
+    Get the date of the last successful add.
+    Returns None if unknown, or if the data file may have changed after
+    that add. Equal timestamps count as changed, since coarse filesystem
+    clocks can give an outside edit the same mtime as the marker.
+    """
+    try:
+        if LAST_ADD_FILE.stat().st_mtime_ns <= DATA_FILE.stat().st_mtime_ns:
+            return None
+        return LAST_ADD_FILE.read_text().strip() or None
+    except OSError:
+        return None
+
+
+def mark_last_add(date: str):
+    """Record date as the last successful add (best-effort, atomic)."""
+    try:
+        write_atomic(LAST_ADD_FILE, date.encode("utf-8"))
+    except OSError:
+        pass
 
 
 def validate_entry(entry: Dict) -> tuple[bool, Optional[str]]:
@@ -43,26 +223,12 @@ def validate_entry(entry: Dict) -> tuple[bool, Optional[str]]:
     Validate a single data entry.
     Returns (is_valid, error_message).
     """
-    required_fields = ["date", "sleep_hours", "focus", "mood", "work_hours", "social", "timestamp"]
-    
     # Check all fields present
-    for field in required_fields:
+    for field in _REQUIRED_FIELDS:
         if field not in entry:
             return False, f"Missing required field: {field}"
     
-    # Validate date format
-    try:
-        datetime.strptime(entry["date"], "%Y-%m-%d")
-    except ValueError:
-        return False, "Date must be in YYYY-MM-DD format"
-    
-    # Validate timestamp format
-    try:
-        datetime.fromisoformat(entry["timestamp"])
-    except (ValueError, TypeError):
-        return False, "Timestamp must be in ISO format"
-    
-    # Validate types and ranges
+    # Validate types and ranges (cheap checks before any date parsing)
     try:
         sleep_hours = float(entry["sleep_hours"])
         if sleep_hours < 0 or sleep_hours > 24:
@@ -81,16 +247,76 @@ def validate_entry(entry: Dict) -> tuple[bool, Optional[str]]:
             return False, "work_hours must be between 0 and 24"
         
         social = entry["social"]
-        valid_social = ["none", "online", "casual", "meaningful", "deep"]
-        if social not in valid_social:
-            return False, f"social must be one of: {', '.join(valid_social)}"
+        if not isinstance(social, str) or social not in _VALID_SOCIAL:
+            return False, f"social must be one of: {', '.join(SOCIAL_TYPES)}"
             
     except (ValueError, TypeError) as e:
         return False, f"Invalid data type: {str(e)}"
     
+    # Validate date format. Requiring the canonical zero-padded form means
+    # plain string comparison orders dates correctly (see _insert_sorted).
+    try:
+        date = entry["date"]
+        if datetime.fromisoformat(date).date().isoformat() != date:
+            raise ValueError(date)
+    except (ValueError, TypeError):
+        return False, "Date must be in YYYY-MM-DD format"
+    
+    # Validate timestamp format
+    try:
+        datetime.fromisoformat(entry["timestamp"])
+    except (ValueError, TypeError):
+        return False, "Timestamp must be in ISO format"
+    
     return True, None
 
 
+def _date_position(entries: List[Dict], date: str) -> int:
+    """
+    Binary search entries, which are sorted by date (newest first), for the
+    first position whose date is not newer than date.
+    Validated dates are fixed-width ISO strings, so they compare in date
+    order without being parsed.
+    """
+    lo, hi = 0, len(entries)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if entries[mid]["date"] > date:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _insert_sorted(entries: List[Dict], entry: Dict):
+    """
+    Insert entry into entries, which are sorted by date (newest first).
+    Binary search for the position instead of re-sorting the whole list.
+    """
+    entries.insert(_date_position(entries, entry["date"]), entry)
+
+
+def _upsert_sorted(entries: List[Dict], entry: Dict):
+    """
+    Replace the entry in entries with entry's date, or insert entry in date
+    order if there is none. entries are sorted by date (newest first).
+    """
+    date = entry["date"]
+    pos = _date_position(entries, date)
+    if pos < len(entries) and entries[pos]["date"] == date:
+        entries[pos] = entry
+        return
+    
+    # The file may not be sorted (e.g. edited by hand), so check every entry
+    # before concluding the date is new
+    for i, e in enumerate(entries):
+        if e["date"] == date:
+            entries[i] = entry
+            return
+    
+    entries.insert(pos, entry)
+
+
 def add_entry(entry: Dict) -> tuple[bool, Optional[str]]:
     """
     Add a new entry to the data store.
@@ -105,15 +331,28 @@ def add_entry(entry: Dict) -> tuple[bool, Optional[str]]:
     data = load_data()
     
     # Check for duplicate date
-    for existing in data["entries"]:
-        if existing["date"] == entry["date"]:
-            return False, f"Entry for {entry['date']} already exists"
+    if entry["date"] in _date_index(data):
+        return False, f"Entry for {entry['date']} already exists"
+    
+    # Add entry (keeping newest first) and save
+    _insert_sorted(data["entries"], entry)
     
-    # Add entry and save
-    data["entries"].append(entry)
+    save_data(data)
+    return True, None
+
+
+def upsert_entry(entry: Dict) -> tuple[bool, Optional[str]]:
+    """
+    Add an entry, replacing any existing entry for the same date.
+    Returns (success, error_message).
+    """
+    # Validate entry
+    is_valid, error = validate_entry(entry)
+    if not is_valid:
+        return False, error
     
-    # Sort by date (newest first)
-    data["entries"].sort(key=lambda x: x["date"], reverse=True)
+    data = load_data()
+    _upsert_sorted(data["entries"], entry)
     
     save_data(data)
     return True, None
@@ -124,6 +363,14 @@ def get_entries(days: Optional[int] = None) -> List[Dict]:
     Get entries, optionally limited to the last N days.
     Returns entries sorted by date (newest first).
     """
+    if days is not None and days > 0:
+        # Unless the file is already parsed, read just the lines needed
+        _init_data_file()
+        if _CACHE["data"] is None or _CACHE["stamp"] != _file_stamp():
+            entries = _read_first_entries(days)
+            if entries is not None:
+                return entries
+    
     data = load_data()
     entries = data["entries"]
     
@@ -133,10 +380,41 @@ def get_entries(days: Optional[int] = None) -> List[Dict]:
     return entries
 
 
+def _build_columns(entries: List[Dict]) -> Dict:
+    """Build parallel arrays for entries (see load_columns)."""
+    # Imported here so commands that never need arrays don't load numpy
+    import numpy as np
+    
+    n = len(entries)
+    social_index = {social: i for i, social in enumerate(SOCIAL_TYPES)}
+    columns = {"date": np.array([e["date"] for e in entries], dtype="U10")}
+    for metric in ("sleep_hours", "focus", "mood", "work_hours"):
+        columns[metric] = np.fromiter((e[metric] for e in entries), dtype=np.float64, count=n)
+    columns["social_idx"] = np.fromiter(
+        (social_index.get(e["social"], 0) for e in entries), dtype=np.int8, count=n
+    )
+    return columns
+
+
+def load_columns(days: Optional[int] = None) -> Dict:
+    """
+    Get entries as parallel NumPy arrays (struct-of-arrays), newest first.
+    Keys are "date", the four numeric metrics and "social_idx" (index into
+    SOCIAL_TYPES). Arrays are built once per load, optionally limited to
+    the last N days.
+    """
+    data = load_data()
+    columns = data.get("_columns")
+    if columns is None:
+        columns = _build_columns(data["entries"])
+        data["_columns"] = columns
+    
+    if days is not None and days > 0:
+        return {key: values[:days] for key, values in columns.items()}
+    
+    return columns
+
+
 def get_entry_by_date(date: str) -> Optional[Dict]:
     """Get a specific entry by date."""
-    data = load_data()
-    for entry in data["entries"]:
-        if entry["date"] == date:
-            return entry
-    return None
+    return _date_index(load_data()).get(date)
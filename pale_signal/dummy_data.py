@@ -3,8 +3,11 @@ Dummy data generator for pale-signal.
 Provides sample data for testing and demonstration.
 """
 
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+
+import numpy as np
+
+from .data_store import SOCIAL_TYPES
 
 
 def generate_dummy_data(days=30):
@@ -12,34 +15,42 @@ def generate_dummy_data(days=30):
     Generate dummy data for testing.
     Returns a list of entries for the last N days.
     """
-    entries = []
+    # Like range(days), a negative count just means no entries
+    days = max(days, 0)
+    rng = np.random.default_rng()
     today = datetime.now()
     
-    # Social types for variety
-    social_types = ["none", "online", "casual", "meaningful", "deep"]
+    # One timestamp per day, counting back from now
+    stamps = np.datetime64(today, "us") - np.arange(days).astype("timedelta64[D]")
+    timestamps = np.datetime_as_string(stamps, unit="us").tolist()
+    # ISO timestamps start with the date, so one formatting pass serves both
+    dates = [ts[:10] for ts in timestamps]
+    
+    # Generate realistic-looking data with some patterns
+    base_sleep = 7.0 + rng.uniform(-1.5, 1.5, days)
+    focus = np.clip(6 + rng.integers(-2, 4, days), 1, 10)
+    mood = np.clip(6 + rng.integers(-2, 4, days), 1, 10)
     
-    for i in range(days):
-        date = (today - timedelta(days=i)).strftime("%Y-%m-%d")
-        timestamp = (today - timedelta(days=i)).isoformat()
-        
-        # Generate realistic-looking data with some patterns
-        base_sleep = 7.0 + random.uniform(-1.5, 1.5)
-        base_focus = 6 + random.randint(-2, 3)
-        base_mood = 6 + random.randint(-2, 3)
-        
-        # Correlate work hours inversely with sleep
-        work_hours = 8.0 - (base_sleep - 7.0) + random.uniform(-1, 1)
-        work_hours = max(4.0, min(12.0, work_hours))
-        
-        entry = {
+    # Correlate work hours inversely with sleep
+    work_hours = 8.0 - (base_sleep - 7.0) + rng.uniform(-1, 1, days)
+    work_hours = np.clip(work_hours, 4.0, 12.0)
+    
+    sleep_hours = np.round(np.clip(base_sleep, 4.0, 10.0), 1)
+    work_hours = np.round(work_hours, 1)
+    social = rng.choice(SOCIAL_TYPES, days)
+    
+    return [
+        {
             "date": date,
-            "sleep_hours": round(max(4.0, min(10.0, base_sleep)), 1),
-            "focus": max(1, min(10, base_focus)),
-            "mood": max(1, min(10, base_mood)),
-            "work_hours": round(work_hours, 1),
-            "social": random.choice(social_types),
+            "sleep_hours": sleep,
+            "focus": f,
+            "mood": m,
+            "work_hours": work,
+            "social": s,
             "timestamp": timestamp
         }
-        entries.append(entry)
-    
-    return entries
+        for date, sleep, f, m, work, s, timestamp in zip(
+            dates, sleep_hours.tolist(), focus.tolist(), mood.tolist(),
+            work_hours.tolist(), social.tolist(), timestamps
+        )
+    ]
@@ -3,17 +3,33 @@ Visualization module for pale-signal.
 Creates clean, minimal plots using matplotlib.
 """
 
+import hashlib
+import io
 import os
+import shutil
 from pathlib import Path
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend to avoid Tcl/Tk issues
-import matplotlib.pyplot as plt
-from typing import List, Dict, Optional
+import numpy as np
+from typing import List, Dict, Optional, Union
+
+from .data_store import SOCIAL_TYPES, write_atomic
 
 
 # Store plots in user's home directory
 OUTPUT_DIR = Path.home() / ".pale-signal" / "output"
 
+# Set once OUTPUT_DIR is known to exist in this process
+_OUTPUT_READY = False
+
+# matplotlib.pyplot, imported on first use (see _pyplot)
+_plt = None
+
+# Part of every plot cache key; bump it whenever rendering changes so PNGs
+# cached by an older version are not served
+PLOT_FORMAT = 2
+
+# Figure reused by every plot_metric call in this process (see _figure)
+_FIG = None
+
 
 # Metric display names and thresholds
 METRIC_CONFIG = {
@@ -45,16 +61,109 @@ METRIC_CONFIG = {
 }
 
 
-def plot_metric(entries: List[Dict], metric: str, show: bool = True):
+def _pyplot():
+    """
+    Import matplotlib.pyplot on first use.
+    matplotlib is slow to import and only the PNG plot needs it.
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend to avoid Tcl/Tk issues
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
+
+
+def _figure():
+    """
+    Get the shared figure with its axes cleared, creating it on first use.
+    Creating a figure costs far more than clearing one.
+    """
+    global _FIG
+    if _FIG is None:
+        _FIG, ax = _pyplot().subplots(figsize=(12, 6))
+    else:
+        ax = _FIG.axes[0]
+        ax.cla()
+    return _FIG, ax
+
+
+# Social category -> y value, matching load_columns' social_idx encoding
+_SOCIAL_IDX = {social: i for i, social in enumerate(SOCIAL_TYPES)}
+_SOCIAL_GET = _SOCIAL_IDX.get
+
+
+# A list of entries, or the arrays returned by data_store.load_columns()
+Entries = Union[List[Dict], Dict[str, np.ndarray]]
+
+
+def _count(entries: Entries) -> int:
+    """Number of entries in either representation."""
+    if isinstance(entries, dict):
+        return len(entries["date"])
+    return len(entries)
+
+
+def _dates(entries: Entries) -> List[str]:
+    """Extract entry dates, oldest first."""
+    if isinstance(entries, dict):
+        return entries["date"][::-1].tolist()
+    return [entry["date"] for entry in reversed(entries)]
+
+
+def _values(entries: Entries, metric: str) -> list:
+    """
+    Extract a metric's values, oldest first.
+    Social categories are converted to numbers 0-4.
+    """
+    if isinstance(entries, dict):
+        # Columns are already numeric; just reverse
+        key = "social_idx" if metric == "social" else metric
+        return entries[key][::-1].tolist()
+    
+    # Reverse entries to show oldest to newest
+    entries = list(reversed(entries))
+    
+    if metric == "social":
+        # Unknown categories plot as "none"
+        return [_SOCIAL_GET(entry[metric], 0) for entry in entries]
+    
+    return [entry[metric] for entry in entries]
+
+
+def _plot_key(dates: List[str], values: np.ndarray, metric: str) -> str:
+    """Content hash of everything a plot is drawn from, plus PLOT_FORMAT."""
+    h = hashlib.blake2b(digest_size=12)
+    h.update(f"{PLOT_FORMAT}|{metric}".encode())
+    h.update("\0".join(dates).encode())
+    h.update(values.tobytes())
+    return h.hexdigest()
+
+
+def _prune_cached_plots(metric: str, keep: Path):
+    """Remove cached renders of metric other than keep (older data)."""
+    for path in Path(OUTPUT_DIR).glob(f"{metric}-*.png"):
+        if path != keep:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def plot_metric(entries: Entries, metric: str, show: bool = True, use_cache: bool = True):
     """
     Create a line plot for a single metric over time.
     
     Args:
-        entries: List of data entries (sorted newest first)
+        entries: List of data entries or load_columns() arrays (sorted newest first)
         metric: Name of the metric to plot
         show: Whether to display the plot immediately
+        use_cache: Reuse and keep a render of the same data (off for demo data)
     """
-    if not entries:
+    global _OUTPUT_READY
+    
+    if not _count(entries):
         print("No data to plot.")
         return
     
@@ -62,35 +171,43 @@ def plot_metric(entries: List[Dict], metric: str, show: bool = True):
         print(f"Unknown metric: {metric}")
         return
     
-    # Reverse entries to show oldest to newest on x-axis
-    entries = list(reversed(entries))
+    # Extract data, oldest to newest on x-axis
+    dates = _dates(entries)
+    values = _values(entries, metric)
+    arr = np.asarray(values, dtype=np.float64)
     
-    # Extract data
-    dates = [entry["date"] for entry in entries]
+    # Create output directory if it doesn't exist
+    if not _OUTPUT_READY:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        _OUTPUT_READY = True
     
-    # For social metric, convert categories to numbers for plotting
-    if metric == "social":
-        social_map = {"none": 0, "online": 1, "casual": 2, "meaningful": 3, "deep": 4}
-        values = [social_map.get(entry[metric], 0) for entry in entries]
+    # Renders are cached by content; unchanged data skips matplotlib entirely
+    filename = os.path.join(OUTPUT_DIR, f"{metric}_plot.png")
+    if use_cache:
+        cached = Path(OUTPUT_DIR) / f"{metric}-{_plot_key(dates, arr, metric)}.png"
+        if cached.exists():
+            shutil.copyfile(cached, filename)
+            return filename
+        target = cached
     else:
-        values = [entry[metric] for entry in entries]
+        target = Path(filename)
     
-    # Calculate rolling average (7-day)
-    rolling_avg = []
-    for i in range(len(values)):
-        start_idx = max(0, i - 6)
-        window = values[start_idx:i+1]
-        rolling_avg.append(sum(window) / len(window))
+    # Calculate rolling average (7-day) from prefix sums; early points
+    # average over however many days are available
+    cs = np.concatenate(([0.0], np.cumsum(arr)))
+    idx = np.arange(len(arr))
+    lo = np.maximum(0, idx - 6)
+    rolling_avg = ((cs[idx + 1] - cs[lo]) / (idx + 1 - lo)).tolist()
     
     # Create plot
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _figure()
     
     # Plot main line
     ax.plot(dates, values, marker='o', linewidth=2, markersize=6, 
             label=METRIC_CONFIG[metric]["label"], color='#2563eb')
     
     # Plot rolling average
-    if len(entries) >= 7:
+    if len(values) >= 7:
         ax.plot(dates, rolling_avg, linestyle='--', linewidth=1.5, 
                 label='7-day average', color='#dc2626', alpha=0.7)
     
@@ -111,86 +228,91 @@ def plot_metric(entries: List[Dict], metric: str, show: bool = True):
     
     # For social metric, add category labels on y-axis
     if metric == "social":
-        ax.set_yticks([0, 1, 2, 3, 4])
-        ax.set_yticklabels(['none', 'online', 'casual', 'meaningful', 'deep'])
+        ax.set_yticks(range(len(SOCIAL_TYPES)))
+        ax.set_yticklabels(SOCIAL_TYPES)
     
     # Rotate x-axis labels for readability
-    plt.xticks(rotation=45, ha='right')
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
     
-    # Adjust layout to prevent label cutoff
-    plt.tight_layout()
+    # Adjust layout to prevent label cutoff (instead of a second,
+    # bbox_inches='tight' render pass in savefig)
+    fig.tight_layout()
     
-    # Create output directory if it doesn't exist
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    # Save to file instead of showing (avoids backend issues); the figure
+    # is kept open for the next plot. Rendering to memory and writing
+    # atomically means an interrupted render never leaves a broken PNG.
+    buf = io.BytesIO()
+    fig.savefig(buf, dpi=150, format="png")
+    write_atomic(target, buf.getvalue())
     
-    # Save to file instead of showing (avoids backend issues)
-    filename = os.path.join(OUTPUT_DIR, f"{metric}_plot.png")
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
-    plt.close()
+    if use_cache:
+        _prune_cached_plots(metric, cached)
+        shutil.copyfile(cached, filename)
     
     return filename
 
 
-def generate_ascii_plot(entries: List[Dict], metric: str, width: int = 60, height: int = 15):
+def generate_ascii_plot(entries: Entries, metric: str, width: int = 60, height: int = 15):
     """
     Generate a simple ASCII plot for terminal display.
     
     Args:
-        entries: List of data entries (sorted newest first)
+        entries: List of data entries or load_columns() arrays (sorted newest first)
         metric: Name of the metric to plot
         width: Width of the plot in characters
         height: Height of the plot in lines
     """
-    if not entries or metric not in METRIC_CONFIG:
+    if not _count(entries) or metric not in METRIC_CONFIG:
         return ""
     
-    # Reverse to show oldest to newest
-    entries = list(reversed(entries))
-    
-    # Extract values
-    if metric == "social":
-        social_map = {"none": 0, "online": 1, "casual": 2, "meaningful": 3, "deep": 4}
-        values = [social_map.get(entry[metric], 0) for entry in entries]
-    else:
-        values = [entry[metric] for entry in entries]
+    # Extract values, oldest to newest
+    values = _values(entries, metric)
     
     if not values:
         return ""
     
+    n = len(values)
+    
     # Normalize values to fit in height
     min_val = min(values)
     max_val = max(values)
     val_range = max_val - min_val if max_val != min_val else 1
     
+    # Screen coordinates for every point at once
+    if n > 1:
+        xs = ((np.arange(n) / (n - 1)) * (width - 1)).astype(np.int64)
+    else:
+        xs = np.full(1, width // 2)
+    arr = np.asarray(values, dtype=np.float64)
+    ys = height - 1 - (((arr - min_val) / val_range) * (height - 1)).astype(np.int64)
+    ys = ys.clip(0, height - 1)
+    
     # Create plot grid
-    plot = [[' ' for _ in range(width)] for _ in range(height)]
-    
-    # Plot points
-    for i, val in enumerate(values):
-        x = int((i / (len(values) - 1)) * (width - 1)) if len(values) > 1 else width // 2
-        y = height - 1 - int(((val - min_val) / val_range) * (height - 1))
-        y = max(0, min(height - 1, y))
-        plot[y][x] = '●'
-        
-        # Connect with lines
-        if i > 0:
-            prev_val = values[i - 1]
-            prev_x = int(((i - 1) / (len(values) - 1)) * (width - 1)) if len(values) > 1 else width // 2
-            prev_y = height - 1 - int(((prev_val - min_val) / val_range) * (height - 1))
-            prev_y = max(0, min(height - 1, prev_y))
-            
-            # Simple line drawing
-            if prev_x < x:
-                for px in range(prev_x + 1, x):
-                    py = prev_y + int((y - prev_y) * (px - prev_x) / (x - prev_x))
-                    if 0 <= py < height:
-                        plot[py][px] = '─'
+    plot = np.full((height, width), ' ', dtype='U1')
+    
+    # Connect consecutive points with lines: every column strictly between
+    # two points gets the linearly interpolated row, for all segments at once
+    x0, dx = xs[:-1], np.diff(xs)
+    gaps = np.maximum(dx - 1, 0)
+    seg = np.repeat(np.arange(n - 1), gaps)
+    # Offset of each column from its segment's start point (1, 2, ...)
+    step = np.arange(len(seg)) - np.repeat(np.cumsum(gaps) - gaps, gaps) + 1
+    px = x0[seg] + step
+    # Casting truncates toward zero, as int() does
+    py = ys[seg] + ((ys[seg + 1] - ys[seg]) * step / dx[seg]).astype(np.int64)
+    inside = (py >= 0) & (py < height)
+    plot[py[inside], px[inside]] = '─'
+    
+    # Plot points (lines only fill columns strictly between points)
+    plot[ys, xs] = '●'
     
     # Build output
     output = []
-    output.append(f"\n{METRIC_CONFIG[metric]['label']} (Last {len(entries)} days)")
+    output.append(f"\n{METRIC_CONFIG[metric]['label']} (Last {n} days)")
     output.append("┌" + "─" * width + "┐")
-    for row in plot:
+    for row in plot.tolist():
         output.append("│" + "".join(row) + "│")
     output.append("└" + "─" * width + "┘")
     output.append(f"  Min: {min_val:.1f}  Max: {max_val:.1f}  Avg: {sum(values)/len(values):.1f}")